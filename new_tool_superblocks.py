@@ -1,11 +1,21 @@
-import copy
+import io
 import json
 import re
 import os
+import sys
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from hashlib import blake2b
 from typing import Any, Dict, List, Optional, Tuple
 
+try:
+    from orjson import loads as _loads
+except ImportError:
+    _loads = json.loads
+
 # ---------- Shared constants ----------
-IGNORED_KEYS = {
+IGNORED_KEYS = frozenset({
     "type",
     "url",
     "imageURL",
@@ -13,16 +23,43 @@ IGNORED_KEYS = {
     "appID",
     "backgroundImageURL",
     "textHex",
-}
-IGNORED_PREFIXES = {"30", "demo", "TEST", "OLD", "_", "tier"}
+})
+IGNORED_PREFIXES = frozenset({"30", "demo", "TEST", "OLD", "_", "tier"})
+_IGNORED_PREFIXES_LOWER = tuple(p.lower() for p in IGNORED_PREFIXES)
 OCCV_APPS_RE = re.compile(r"/ocvapps/[^/]+/", re.IGNORECASE)
 
+# Per-run caches keyed on id(node). Identity keying is safe only for nodes
+# that are never mutated after being cached: master/spec trees and audit
+# inputs. The update path mutates working headers in place, so digests on
+# that side are computed cache-free (_canon_digest_fresh). Cached nodes must
+# stay alive for the whole run (the keepalive list prevents id reuse for
+# short-lived temporaries). Reset at each pipeline entry point.
+_NORM_CACHE: Dict[int, Tuple] = {}
+_DIGEST_CACHE: Dict[int, bytes] = {}
+_LIST_KEY_CACHE: Dict[int, Tuple] = {}
+_SEEN_NORMS: Dict[int, set] = {}
+_MASTER_LIST_INDEX: Dict[int, List[Tuple[Any, Any, Any]]] = {}
+_REMOVE_NORMS_CACHE: Dict[int, set] = {}
+_NORM_KEEPALIVE: List[Any] = []
+
+
+def _reset_run_caches() -> None:
+    _NORM_CACHE.clear()
+    _DIGEST_CACHE.clear()
+    _LIST_KEY_CACHE.clear()
+    _SEEN_NORMS.clear()
+    _MASTER_LIST_INDEX.clear()
+    _REMOVE_NORMS_CACHE.clear()
+    _NORM_KEEPALIVE.clear()
+
 
 # ---------- Utils ----------
-def parse_json_maybe_double_encoded(raw: str) -> Any:
-    obj = json.loads(raw)
-    while isinstance(obj, str):
-        obj = json.loads(obj)
+def parse_json_maybe_double_encoded(raw: Any) -> Any:
+    # readContents may hand back bytes; both orjson and json accept them
+    # directly, so skip the decode and keep unwrapping string/bytes roots.
+    obj = _loads(raw)
+    while isinstance(obj, (str, bytes)):
+        obj = _loads(obj)
     return obj
 
 
@@ -33,11 +70,7 @@ def unwrap_manifest(obj: Any) -> Any:
 
 
 def select_app_headers(manifest: Dict[str, Any]) -> List[str]:
-    def is_ignored(name: str) -> bool:
-        lowered = name.lower()
-        return any(lowered.startswith(prefix.lower()) for prefix in IGNORED_PREFIXES)
-
-    return [k for k in manifest.keys() if not is_ignored(k)]
+    return [k for k in manifest.keys() if not k.lower().startswith(_IGNORED_PREFIXES_LOWER)]
 
 
 def extract_master_label(file_entry: Any) -> str:
@@ -49,112 +82,310 @@ def extract_master_label(file_entry: Any) -> str:
     return "featureHubs"
 
 
+@lru_cache(maxsize=65536)
 def sanitize_string(value: str) -> str:
-    return OCCV_APPS_RE.sub("/ocvapps/<APP>/", value)
+    # Most strings never mention /ocvapps/; a cheap search avoids the full
+    # substitution pipeline, and the cache covers values repeated across
+    # headers (feature types, labels, URL skeletons).
+    # Interned results make the seen-set and normalize-tuple comparisons
+    # pointer-fast; the lru_cache means each distinct string pays once.
+    # Very long strings are left alone to keep the intern table small.
+    if OCCV_APPS_RE.search(value) is None:
+        return sys.intern(value) if len(value) < 4096 else value
+    sanitized = OCCV_APPS_RE.sub("/ocvapps/<APP>/", value)
+    return sys.intern(sanitized) if len(sanitized) < 4096 else sanitized
+
+
+# Rank scalars so normalized forms have a total order without serializing
+# them. bool/int/float share a rank (and compare numerically) so equality
+# classes match plain `==` on the raw values.
+_SCALAR_RANK = {type(None): 0, bool: 1, int: 1, float: 1, str: 2}
+
+
+def _norm_child(value: Any) -> Tuple[str, Any]:
+    # Resolve an already-visited container from the cache, or build the
+    # scalar form inline. Only valid while normalize() drives the traversal.
+    t = type(value)
+    if t is str:
+        return ("scalar", 2, sanitize_string(value))
+    if t is dict or t is list:
+        return _NORM_CACHE[id(value)]
+    return ("scalar", _SCALAR_RANK.get(t, 3), value)
+
+
+def normalize(node: Any) -> Tuple[str, Any]:
+    # JSON-loaded data never subclasses dict/list, so exact-type checks are
+    # both safe and cheaper than isinstance in these hot walkers.
+    t = type(node)
+    if t is str:
+        return ("scalar", 2, sanitize_string(node))
+    if t is not dict and t is not list:
+        return ("scalar", _SCALAR_RANK.get(t, 3), node)
+    cached = _NORM_CACHE.get(id(node))
+    if cached is not None:
+        return cached
+
+    # Iterative post-order walk: container frames are revisited once their
+    # children are cached, so deep manifests cost no Python stack frames.
+    ignored = IGNORED_KEYS
+    stack: List[Tuple[Any, bool]] = [(node, False)]
+    while stack:
+        n, children_done = stack.pop()
+        nid = id(n)
+        if nid in _NORM_CACHE:
+            continue
+        tn = type(n)
+        if children_done:
+            if tn is dict:
+                # Interned keys hash/compare by pointer in the sort and in
+                # later tuple equality, and the parser's duplicate key
+                # strings collapse. Most dicts carry no ignored keys, so a
+                # single C-level isdisjoint check skips the per-key filter.
+                if ignored.isdisjoint(n):
+                    pairs = ((sys.intern(k), _norm_child(v)) for k, v in n.items())
+                else:
+                    pairs = (
+                        (sys.intern(k), _norm_child(v))
+                        for k, v in n.items()
+                        if k not in ignored
+                    )
+                result = ("dict", tuple(sorted(pairs)))
+            else:
+                result = ("list", tuple(sorted(_norm_child(i) for i in n)))
+            _NORM_CACHE[nid] = result
+            _NORM_KEEPALIVE.append(n)
+            continue
+        stack.append((n, True))
+        if tn is dict:
+            for k, v in n.items():
+                if k not in ignored and type(v) in (dict, list):
+                    stack.append((v, False))
+        else:
+            for i in n:
+                if type(i) in (dict, list):
+                    stack.append((i, False))
+    return _NORM_CACHE[id(node)]
+
+
+def _canon_form(norm: Tuple[str, Any]) -> Tuple[str, Any]:
+    # repr() distinguishes 1 / 1.0 / True while tuple equality does not;
+    # collapse rank-1 scalars to a single representative so digests agree
+    # exactly with normalize-tuple equality.
+    tag = norm[0]
+    if tag == "scalar":
+        v = norm[2]
+        tv = type(v)
+        if tv is bool or (tv is float and v.is_integer()):
+            return ("scalar", norm[1], int(v))
+        return norm
+    if tag == "dict":
+        return ("dict", tuple((k, _canon_form(c)) for k, c in norm[1]))
+    return ("list", tuple(_canon_form(c) for c in norm[1]))
+
+
+def _canon_digest(node: Any) -> bytes:
+    """16-byte fingerprint of a node's canonical form.
+
+    Set/dict keying on nested normalize tuples rehashes the whole structure
+    on every probe; a short digest hashes in constant time. Memoized by id
+    like the canonical form itself, and guaranteed to collide exactly when
+    the normalize tuples compare equal.
+    """
+    t = type(node)
+    if t is dict or t is list:
+        cached = _DIGEST_CACHE.get(id(node))
+        if cached is not None:
+            return cached
+    digest = blake2b(repr(_canon_form(normalize(node))).encode(), digest_size=16).digest()
+    if t is dict or t is list:
+        _DIGEST_CACHE[id(node)] = digest
+        _NORM_KEEPALIVE.append(node)
+    return digest
+
+
+def _canon_form_fresh(node: Any) -> Tuple[str, Any]:
+    # Cache-free twin of normalize + _canon_form. The update path mutates
+    # working-tree dicts in place, so id-keyed cache entries for them go
+    # stale; this walk recomputes the canonical form every time.
+    t = type(node)
+    if t is dict:
+        if IGNORED_KEYS.isdisjoint(node):
+            pairs = ((k, _canon_form_fresh(v)) for k, v in node.items())
+        else:
+            pairs = (
+                (k, _canon_form_fresh(v))
+                for k, v in node.items()
+                if k not in IGNORED_KEYS
+            )
+        return ("dict", tuple(sorted(pairs)))
+    if t is list:
+        return ("list", tuple(sorted(_canon_form_fresh(i) for i in node)))
+    if t is str:
+        return ("scalar", 2, sanitize_string(node))
+    if t is bool or (t is float and node.is_integer()):
+        return ("scalar", 1, int(node))
+    return ("scalar", _SCALAR_RANK.get(t, 3), node)
 
 
-def normalize(node: Any, path: List[str]) -> Tuple[str, Any]:
-    if isinstance(node, dict):
-        filtered = {k: v for k, v in node.items() if k not in IGNORED_KEYS}
-        return (
-            "dict",
-            tuple(sorted((k, normalize(v, path + [k])) for k, v in filtered.items())),
-        )
-    if isinstance(node, list):
-        norm_items = [normalize(i, path) for i in node]
-        norm_sorted = tuple(sorted(norm_items, key=lambda x: json.dumps(x, sort_keys=True)))
-        return ("list", norm_sorted)
-    if isinstance(node, str):
-        return ("scalar", sanitize_string(node))
-    return ("scalar", node)
+def _canon_digest_fresh(node: Any) -> bytes:
+    """Digest of a possibly-mutated node, bypassing every id-keyed cache.
+
+    Produces the same bytes as _canon_digest for equal trees; use it for
+    working-tree nodes the remove/update helpers mutate in place.
+    """
+    return blake2b(repr(_canon_form_fresh(node)).encode(), digest_size=16).digest()
 
 
-def meaningfully_equal(a: Any, b: Any, path: List[str]) -> bool:
-    return normalize(a, path) == normalize(b, path)
+_NUMERIC_TYPES = (int, float, bool)
+
+
+def meaningfully_equal(a: Any, b: Any) -> bool:
+    # Most comparisons are scalar leaves; settle those without building two
+    # normalized tuples. The identity check wins whenever master and app
+    # share interned strings from a common source JSON.
+    if a is b:
+        return True
+    ta = type(a)
+    tb = type(b)
+    if ta is str and tb is str:
+        return sanitize_string(a) == sanitize_string(b)
+    if ta in _NUMERIC_TYPES and tb in _NUMERIC_TYPES:
+        return a == b
+    if ta is not tb:
+        return False
+    return normalize(a) == normalize(b)
 
 
 def list_key(item: Any) -> Any:
-    if isinstance(item, dict):
+    if type(item) is dict:
+        cached = _LIST_KEY_CACHE.get(id(item))
+        if cached is not None:
+            return cached
+        # Integer tags (featureID / type+header / type / norm fallback) hash
+        # cheaper than the old string tags; keys never leave this module.
         if "featureID" in item:
-            return ("featureID", item.get("featureID"))
-        item_type = item.get("type")
-        payload = item.get("payload")
-        if item_type and isinstance(payload, dict) and "headerText" in payload:
-            return ("type_header", item_type, payload.get("headerText"))
-        if item_type:
-            return ("type", item_type)
-    try:
-        return ("json", json.dumps(item, sort_keys=True))
-    except TypeError:
-        return ("repr", repr(item))
+            key = (0, item.get("featureID"))
+        else:
+            item_type = item.get("type")
+            payload = item.get("payload")
+            if item_type and type(payload) is dict and "headerText" in payload:
+                key = (1, item_type, payload.get("headerText"))
+            elif item_type:
+                key = (2, item_type)
+            else:
+                # Untagged dicts key on the 16-byte digest; hashing it is
+                # constant-time where the nested canonical tuple is not.
+                key = (3, _canon_digest(item))
+        _LIST_KEY_CACHE[id(item)] = key
+        _NORM_KEEPALIVE.append(item)
+        return key
+    return (3, normalize(item))
 
 
 def count_nodes(node: Any) -> int:
-    if isinstance(node, dict):
-        return len(node) + sum(count_nodes(v) for v in node.values())
-    if isinstance(node, list):
-        return len(node) + sum(count_nodes(i) for i in node)
-    return 1
+    total = 0
+    stack = [node]
+    while stack:
+        n = stack.pop()
+        t = type(n)
+        if t is dict:
+            total += len(n)
+            stack.extend(n.values())
+        elif t is list:
+            total += len(n)
+            stack.extend(n)
+        else:
+            total += 1
+    return total
 
 
 def extract_prefix(header: str, manifest: Dict[str, Any]) -> Optional[str]:
+    # Track the smallest qualifying key in one pass instead of sorting the
+    # whole feature dict just to read its first valid entry.
     features = manifest.get("features", {})
-    for f_key in sorted(features):
-        if f_key == "openSettings":
+    best_key: Optional[str] = None
+    best_analytics: Optional[str] = None
+    for f_key, node in features.items():
+        if f_key == "openSettings" or (best_key is not None and f_key >= best_key):
             continue
-        node = features.get(f_key)
         if isinstance(node, dict):
             analytics = node.get("analyticsName")
             if isinstance(analytics, str) and analytics and not analytics.endswith("|openSettings"):
-                parts = analytics.split("|")
-                if len(parts) >= 2:
-                    return "|".join(parts[:2])
-                return analytics
-    return None
+                best_key = f_key
+                best_analytics = analytics
+    if best_analytics is None:
+        return None
+    # Only the first two segments matter; partition avoids splitting the
+    # whole string.
+    first, sep, rest = best_analytics.partition("|")
+    if not sep:
+        return best_analytics
+    return f"{first}|{rest.partition('|')[0]}"
 
 
 def stringify_leaf(value: Any) -> str:
-    if isinstance(value, str):
+    # Identity checks must come before the numeric branch: a dict keyed
+    # lookup would conflate True with 1. repr matches json.dumps for the
+    # finite numbers JSON parsing can produce.
+    if type(value) is str:
         return value
+    if value is True:
+        return "true"
+    if value is False:
+        return "false"
+    if value is None:
+        return "null"
+    t = type(value)
+    if t is int or t is float:
+        return repr(value)
     return json.dumps(value, sort_keys=True)
 
 
 def deep_copy(value: Any) -> Any:
-    return copy.deepcopy(value)
+    # Manifests are plain JSON: dict/list containers over immutable scalars.
+    # A typed clone skips copy.deepcopy's memo dict and reduce machinery.
+    t = type(value)
+    if t is dict:
+        return {k: deep_copy(v) for k, v in value.items()}
+    if t is list:
+        return [deep_copy(v) for v in value]
+    return value
 
 
 def collect_leaf_values(node: Any) -> set:
     leaves = set()
-
-    def walk(value: Any) -> None:
-        if isinstance(value, dict):
+    ignored = IGNORED_KEYS
+    stack = [node]
+    while stack:
+        value = stack.pop()
+        t = type(value)
+        if t is dict:
             for k, v in value.items():
-                if k in IGNORED_KEYS:
-                    continue
-                walk(v)
-            return
-        if isinstance(value, list):
-            for item in value:
-                walk(item)
-            return
-        leaves.add(stringify_leaf(value))
-
-    walk(node)
+                if k not in ignored:
+                    stack.append(v)
+        elif t is list:
+            stack.extend(value)
+        else:
+            leaves.add(stringify_leaf(value))
     return leaves
 
 
-def prune_missing_to_absent_values(node: Any, app_leaf_values: set) -> Optional[Any]:
-    if isinstance(node, dict):
+def prune_missing_to_absent_values(
+    node: Any, app_leaf_values: set, _ignored: frozenset = IGNORED_KEYS
+) -> Optional[Any]:
+    # _ignored binds the frozenset as a local: no LOAD_GLOBAL per key.
+    t = type(node)
+    if t is dict:
         out: Dict[str, Any] = {}
         for k, v in node.items():
-            if k in IGNORED_KEYS:
+            if k in _ignored:
                 continue
             pruned = prune_missing_to_absent_values(v, app_leaf_values)
             if pruned is not None:
                 out[k] = pruned
         return out if out else None
 
-    if isinstance(node, list):
+    if t is list:
         out_list: List[Any] = []
         for item in node:
             pruned = prune_missing_to_absent_values(item, app_leaf_values)
@@ -165,22 +396,19 @@ def prune_missing_to_absent_values(node: Any, app_leaf_values: set) -> Optional[
     return node if stringify_leaf(node) not in app_leaf_values else None
 
 
-def _json_key(value: Any) -> str:
-    return json.dumps(value, sort_keys=True)
-
-
 def _collect_missing_nodes(node: Any, path: List[str], out: List[Tuple[str, Any]]) -> None:
     """
     Collect missing nodes at their current path without recursively exploding
     each subtree into nested summary entries.
     """
-    if isinstance(node, dict):
+    t = type(node)
+    if t is dict:
         for k, v in node.items():
             next_path = path + [k]
             out.append((".".join(next_path), v))
         return
 
-    if isinstance(node, list):
+    if t is list:
         for idx, item in enumerate(node):
             next_path = path + [f"[{idx}]"]
             out.append((".".join(next_path), item))
@@ -200,7 +428,10 @@ def build_missing_summary(missing_content: Dict[str, Any]) -> List[Dict[str, Any
         _collect_missing_nodes(header_missing, [], nodes)
 
         for path_str, tree in nodes:
-            sig = f"{path_str}|{_json_key(tree)}"
+            # Summary subtrees are freshly built every run, so a digest's id
+            # memo never hits; the normalize tuple dedupes at the same
+            # equality without the extra serialize-and-hash pass.
+            sig = (path_str, normalize(tree))
             if sig not in aggregate:
                 aggregate[sig] = {
                     "path": path_str,
@@ -239,14 +470,25 @@ def _increment_key_label(
 def _increment_key_labels_from_tree(
     node: Any, key_label_counts: Dict[str, Dict[str, Any]], header: str
 ) -> None:
-    if isinstance(node, dict):
-        for k, v in node.items():
-            _increment_key_label(key_label_counts, k, header)
-            _increment_key_labels_from_tree(v, key_label_counts, header)
-        return
-    if isinstance(node, list):
-        for item in node:
-            _increment_key_labels_from_tree(item, key_label_counts, header)
+    # Tally into a local dict first, then merge once per distinct key —
+    # one entry update per key instead of two dict ops per visit.
+    counts: Dict[str, int] = {}
+    stack = [node]
+    while stack:
+        n = stack.pop()
+        t = type(n)
+        if t is dict:
+            for k, v in n.items():
+                counts[k] = counts.get(k, 0) + 1
+                stack.append(v)
+        elif t is list:
+            stack.extend(n)
+    for k, c in counts.items():
+        entry = key_label_counts.get(k)
+        if entry is None:
+            entry = key_label_counts[k] = {"key": k, "count": 0, "headers": set()}
+        entry["count"] += c
+        entry["headers"].add(header)
 
 
 # ---------- Audit ----------
@@ -257,20 +499,48 @@ def _append_child(container: Dict[str, Any], key: str, value: Any) -> None:
 
 
 def _pair_list_items(current: List[Any], master: List[Any]) -> Tuple[List[Tuple[Any, Any]], List[Any], List[Any]]:
-    master_map: Dict[Any, List[Any]] = {}
-    for m_item in master:
-        key = list_key(m_item)
-        master_map.setdefault(key, []).append(m_item)
+    # Master lists are walked once per header; index each one a single time
+    # so repeated headers reuse the (item, norm, key) triples instead of
+    # re-deriving them.
+    triples = _MASTER_LIST_INDEX.get(id(master))
+    if triples is None:
+        triples = [(m_item, normalize(m_item), list_key(m_item)) for m_item in master]
+        _MASTER_LIST_INDEX[id(master)] = triples
+        _NORM_KEEPALIVE.append(master)
+
+    # Pair off exact matches by canonical form first: identical items cannot
+    # contribute to any diff bucket, so they are consumed here and never reach
+    # the heuristic key pairing or the recursive audit.
+    remaining: Dict[Any, int] = {}
+    for _m_item, n, _key in triples:
+        remaining[n] = remaining.get(n, 0) + 1
+
+    current_left: List[Any] = []
+    consumed: Dict[Any, int] = {}
+    for c_item in current:
+        n = normalize(c_item)
+        if remaining.get(n, 0) > 0:
+            remaining[n] -= 1
+            consumed[n] = consumed.get(n, 0) + 1
+        else:
+            current_left.append(c_item)
+
+    master_map: Dict[Any, deque] = {}
+    for m_item, n, key in triples:
+        if consumed.get(n, 0) > 0:
+            consumed[n] -= 1
+            continue
+        master_map.setdefault(key, deque()).append(m_item)
 
     matched: List[Tuple[Any, Any]] = []
     unique_items: List[Any] = []
-    for c_item in current:
+    for c_item in current_left:
         key = list_key(c_item)
         candidates = master_map.get(key)
         if candidates:
-            matched.append((c_item, candidates.pop(0)))
-            if not candidates:
-                master_map.pop(key, None)
+            # An emptied deque is left in place; it is falsy, so later
+            # lookups for the same key still fall through to unique.
+            matched.append((c_item, candidates.popleft()))
         else:
             unique_items.append(deep_copy(c_item))
 
@@ -285,7 +555,6 @@ def _pair_list_items(current: List[Any], master: List[Any]) -> Tuple[List[Tuple[
 def _audit_node(
     current: Any,
     master: Any,
-    path: List[str],
     app_leaf_values: set,
     key_label_counts: Dict[str, Dict[str, Any]],
     header: str,
@@ -299,34 +568,28 @@ def _audit_node(
             _increment_key_labels_from_tree(pruned, key_label_counts, header)
         return None, pruned, None
 
-    if isinstance(current, dict) and isinstance(master, dict):
+    t_current = type(current)
+    t_master = type(master)
+    if t_current is dict and t_master is dict:
         text_diff: Dict[str, Any] = {}
         missing_content: Dict[str, Any] = {}
         unique_content: Dict[str, Any] = {}
 
-        keys = set(current.keys()) | set(master.keys())
-        for key in sorted(keys):
+        # Two direct passes replace the union-set build and sort: app keys
+        # settle the unique/both cases, master keys fill in the missing
+        # case. Result containers are plain dicts, so ordering is free.
+        for key, c_val in current.items():
             if key in IGNORED_KEYS:
                 continue
-            c_has = key in current
-            m_has = key in master
-            if not c_has and m_has:
-                pruned_missing = prune_missing_to_absent_values(master[key], app_leaf_values)
-                if pruned_missing is not None:
-                    missing_content[key] = pruned_missing
-                    _increment_key_label(key_label_counts, key, header)
-                    _increment_key_labels_from_tree(pruned_missing, key_label_counts, header)
-                continue
-            if c_has and not m_has:
-                unique_content[key] = deep_copy(current[key])
+            if key not in master:
+                unique_content[key] = deep_copy(c_val)
                 _increment_key_label(key_label_counts, key, header)
-                _increment_key_labels_from_tree(current[key], key_label_counts, header)
+                _increment_key_labels_from_tree(c_val, key_label_counts, header)
                 continue
 
             t_child, m_child, u_child = _audit_node(
-                current[key],
+                c_val,
                 master[key],
-                path + [key],
                 app_leaf_values,
                 key_label_counts,
                 header,
@@ -337,20 +600,28 @@ def _audit_node(
             if t_child is not None or m_child is not None or u_child is not None:
                 _increment_key_label(key_label_counts, key, header)
 
+        for key, m_val in master.items():
+            if key in IGNORED_KEYS or key in current:
+                continue
+            pruned_missing = prune_missing_to_absent_values(m_val, app_leaf_values)
+            if pruned_missing is not None:
+                missing_content[key] = pruned_missing
+                _increment_key_label(key_label_counts, key, header)
+                _increment_key_labels_from_tree(pruned_missing, key_label_counts, header)
+
         return (
             text_diff if text_diff else None,
             missing_content if missing_content else None,
             unique_content if unique_content else None,
         )
 
-    if isinstance(current, list) and isinstance(master, list):
+    if t_current is list and t_master is list:
         matched, unique_items, missing_items = _pair_list_items(current, master)
         list_text_diff: List[Any] = []
         for c_item, m_item in matched:
             t_child, _, _ = _audit_node(
                 c_item,
                 m_item,
-                path + ["<list-item>"],
                 app_leaf_values,
                 key_label_counts,
                 header,
@@ -370,7 +641,7 @@ def _audit_node(
             unique_items if unique_items else None,
         )
 
-    if isinstance(current, (dict, list)) or isinstance(master, (dict, list)):
+    if t_current in (dict, list) or t_master in (dict, list):
         pruned = prune_missing_to_absent_values(master, app_leaf_values)
         if pruned is not None:
             _increment_key_labels_from_tree(pruned, key_label_counts, header)
@@ -388,17 +659,26 @@ def build_audit(
     input_manifest: Dict[str, Any],
     master: Dict[str, Any],
     input_headers: List[str],
-) -> Tuple[Dict[str, Any], Dict[str, int], Dict[str, int], Dict[str, str]]:
+    need_prefixes: bool = True,
+) -> Tuple[Dict[str, Any], Dict[str, int], Dict[str, int], Dict[str, int], Dict[str, str]]:
+    _reset_run_caches()
     text_diff: Dict[str, Any] = {}
     missing_content: Dict[str, Any] = {}
     unique_content: Dict[str, Any] = {}
+    text_counts: Dict[str, int] = {}
     missing_counts: Dict[str, int] = {}
     unique_counts: Dict[str, int] = {}
     prefixes: Dict[str, str] = {}
     key_label_counts: Dict[str, Dict[str, Any]] = {}
 
-    for header in input_headers:
-        app_header = input_manifest.get(header) if isinstance(input_manifest, dict) else None
+    # Resolve every header up front: one isinstance check for the whole run
+    # instead of one per header, and the loop body reads a plain pair.
+    if isinstance(input_manifest, dict):
+        header_nodes = [(h, input_manifest.get(h)) for h in input_headers]
+    else:
+        header_nodes = []
+
+    for header, app_header in header_nodes:
         if app_header is None:
             continue
 
@@ -406,7 +686,6 @@ def build_audit(
         t_node, m_node, u_node = _audit_node(
             app_header,
             master,
-            [header],
             app_leaf_values,
             key_label_counts,
             header,
@@ -415,12 +694,15 @@ def build_audit(
         missing_content[header] = m_node if m_node is not None else {}
         unique_content[header] = u_node if u_node is not None else {}
 
+        text_counts[header] = count_nodes(t_node) if t_node is not None else 0
         missing_counts[header] = count_nodes(m_node) if m_node is not None else 0
         unique_counts[header] = count_nodes(u_node) if u_node is not None else 0
 
-        prefix = extract_prefix(header, app_header)
-        if prefix:
-            prefixes[header] = prefix
+        # Only merge_outputs reads prefixes; audit modes skip the scan.
+        if need_prefixes:
+            prefix = extract_prefix(header, app_header)
+            if prefix:
+                prefixes[header] = prefix
 
     key_label_summary: List[Dict[str, Any]] = []
     for row in key_label_counts.values():
@@ -442,104 +724,205 @@ def build_audit(
         "summary": build_missing_summary(missing_content),
         "key_label_summary": key_label_summary,
     }
-    return output, missing_counts, unique_counts, prefixes
+    return output, text_counts, missing_counts, unique_counts, prefixes
 
 
 # ---------- Merge ----------
-def merge_overlay_into_master(master: Any, overlay: Any, path: List[str]) -> Any:
+def _merge_into(master: Any, overlay: Any) -> Any:
+    """Merge overlay onto master copy-on-write.
+
+    Master is never mutated: new dict/list nodes are built only along the
+    spine the overlay actually touches, everything else is aliased. That
+    keeps per-header merge cost proportional to the overlay, not the
+    master, and lets the per-master-list seen sets be shared across
+    headers.
+    """
     if overlay is None:
         return master
 
     if master is None:
         return deep_copy(overlay)
 
-    if isinstance(master, dict) and isinstance(overlay, dict):
-        result = deep_copy(master)
+    t_master = type(master)
+    t_overlay = type(overlay)
+    if t_master is dict and t_overlay is dict:
+        out = None
         for k, o_val in overlay.items():
-            if k in result:
-                result[k] = merge_overlay_into_master(result[k], o_val, path + [k])
+            m_val = master.get(k)
+            if k in master:
+                new_val = _merge_into(m_val, o_val)
+                if new_val is m_val:
+                    continue
             else:
-                result[k] = deep_copy(o_val)
-        return result
-
-    if isinstance(master, list) and isinstance(overlay, list):
-        result = deep_copy(master)
-        seen = {normalize(x, path) for x in result}
+                new_val = deep_copy(o_val)
+            if out is None:
+                out = dict(master)
+            out[k] = new_val
+        return out if out is not None else master
+
+    if t_master is list and t_overlay is list:
+        # Master lists are read-only here, so their digest sets persist
+        # across headers instead of being rebuilt per merge.
+        seen = _SEEN_NORMS.get(id(master))
+        if seen is None:
+            seen = {_canon_digest(x) for x in master}
+            _SEEN_NORMS[id(master)] = seen
+            _NORM_KEEPALIVE.append(master)
+        additions = None
+        added: set = set()
         for o in overlay:
-            n = normalize(o, path)
-            if n not in seen:
-                seen.add(n)
-                result.append(deep_copy(o))
-        return result
-
+            d = _canon_digest(o)
+            if d not in seen and d not in added:
+                added.add(d)
+                if additions is None:
+                    additions = []
+                additions.append(deep_copy(o))
+        if additions is None:
+            return master
+        return list(master) + additions
+
+    # Conflicting scalar leaves keep the master value.
     return master
 
 
+def merge_overlay_into_master(master: Any, overlay: Any) -> Any:
+    if overlay is None:
+        return master
+    if master is None:
+        return deep_copy(overlay)
+    return _merge_into(master, overlay)
+
+
+@lru_cache(maxsize=8)
+def _placeholder_pattern(has_prefix: bool, has_app_id: bool) -> "re.Pattern":
+    parts = ["ChangeMe"]
+    if has_prefix:
+        parts.append("PATH")
+    if has_app_id:
+        parts.append(r"(?i:/ocvapps/[^/]+/)")
+    return re.compile("|".join(parts))
+
+
 def _replace_placeholders(node: Any, app_id: str, prefix: Optional[str]) -> Any:
-    if isinstance(node, dict):
-        return {k: _replace_placeholders(v, app_id, prefix) for k, v in node.items()}
-    if isinstance(node, list):
-        return [_replace_placeholders(i, app_id, prefix) for i in node]
-    if isinstance(node, str):
-        replaced = node.replace("ChangeMe", app_id)
-        if prefix:
-            replaced = replaced.replace("PATH", prefix)
-        if app_id:
-            replaced = OCCV_APPS_RE.sub(f"/ocvapps/{app_id}/", replaced)
-        return replaced
-    return node
+    # One combined regex per (app_id, prefix) shape means each string is
+    # scanned once instead of once per placeholder kind, and clean strings
+    # are returned untouched after a single search.
+    pattern = _placeholder_pattern(bool(prefix), bool(app_id))
+    occv_repl = f"/ocvapps/{app_id}/" if app_id else ""
+    # Manifests repeat the same placeholder strings many times; rewrite each
+    # distinct value once per call (app_id/prefix vary per header, so the
+    # memo cannot be module-level).
+    memo: Dict[str, str] = {}
+
+    def repl(match: "re.Match") -> str:
+        token = match.group(0)
+        if token == "ChangeMe":
+            return app_id
+        if token == "PATH":
+            return prefix
+        return occv_repl
+
+    # Containers are rebuilt only when a descendant actually rewrote; clean
+    # subtrees are returned as-is, which keeps the later copy-on-write merge
+    # effective across headers.
+    def walk(n: Any) -> Any:
+        t = type(n)
+        if t is dict:
+            out = None
+            for k, v in n.items():
+                new_v = walk(v)
+                if new_v is not v:
+                    if out is None:
+                        out = dict(n)
+                    out[k] = new_v
+            return out if out is not None else n
+        if t is list:
+            out_list = None
+            for idx, item in enumerate(n):
+                new_item = walk(item)
+                if new_item is not item:
+                    if out_list is None:
+                        out_list = list(n)
+                    out_list[idx] = new_item
+            return out_list if out_list is not None else n
+        if t is str:
+            cached = memo.get(n)
+            if cached is not None:
+                return cached
+            if pattern.search(n) is None:
+                rewritten = n
+            else:
+                rewritten = pattern.sub(repl, n)
+            memo[n] = rewritten
+            return rewritten
+        return n
+
+    return walk(node)
 
 
 def merge_outputs(master_json: dict, diff_output: dict, prefixes: dict, app_id: str) -> dict:
+    _reset_run_caches()
     out = {"manifest": {}}
     for header, header_overlay in diff_output.items():
-        merged = deep_copy(master_json)
-        merged = merge_overlay_into_master(merged, header_overlay, path=[header])
+        merged = merge_overlay_into_master(master_json, header_overlay)
         prefix = prefixes.get(header)
         out["manifest"][header] = _replace_placeholders(merged, app_id, prefix)
     return out
 
 
 # ---------- Update ----------
-def _matches_remove_pattern(target: Any, pattern: Any, path: List[str]) -> bool:
+def _matches_remove_pattern(target: Any, pattern: Any) -> bool:
     if pattern is None:
         return True
 
-    if isinstance(pattern, dict):
-        if not isinstance(target, dict):
+    t_pattern = type(pattern)
+    if t_pattern is dict:
+        if type(target) is not dict:
             return False
         for k, p_val in pattern.items():
             if k not in target:
                 return False
-            if not _matches_remove_pattern(target[k], p_val, path + [k]):
+            if not _matches_remove_pattern(target[k], p_val):
                 return False
         return True
 
-    if isinstance(pattern, list):
-        if not isinstance(target, list):
+    if t_pattern is list:
+        if type(target) is not list:
             return False
         if len(pattern) == 0:
             return True
-        target_norms = {normalize(x, path) for x in target}
-        pattern_norms = {normalize(x, path) for x in pattern}
-        return len(target_norms.intersection(pattern_norms)) > 0
+        # Targets are working-tree nodes that earlier removals may have
+        # mutated; digest them cache-free. Patterns come from master.
+        target_digests = {_canon_digest_fresh(x) for x in target}
+        pattern_digests = {_canon_digest(x) for x in pattern}
+        return not target_digests.isdisjoint(pattern_digests)
 
-    return meaningfully_equal(target, pattern, path)
+    return meaningfully_equal(target, pattern)
 
 
-def _apply_remove_list_by_pattern(current_list: List[Any], remove_list: List[Any], path: List[str]) -> None:
+def _apply_remove_list_by_pattern(current_list: List[Any], remove_list: List[Any]) -> None:
     if not current_list or not remove_list:
         return
 
-    remove_norms = {normalize(x, path) for x in remove_list}
+    # The same spec list is swept against many target lists; build its norm
+    # set once per run. Spec lists come from master and are never mutated.
+    # Digest keys honor cross-numeric equality (a spec's 1 matches a
+    # manifest's 1.0) because _canon_digest canonicalizes numerics.
+    remove_norms = _REMOVE_NORMS_CACHE.get(id(remove_list))
+    if remove_norms is None:
+        remove_norms = {_canon_digest(x) for x in remove_list}
+        _REMOVE_NORMS_CACHE[id(remove_list)] = remove_norms
+        _NORM_KEEPALIVE.append(remove_list)
     kept: List[Any] = []
     for item in current_list:
-        if normalize(item, path) in remove_norms:
+        # Working-tree items may have been mutated by an earlier pattern
+        # pass, so their digests cannot come from the id-keyed cache.
+        if _canon_digest_fresh(item) in remove_norms:
             continue
         kept.append(item)
     current_list[:] = kept
 
-    dict_patterns = [x for x in remove_list if isinstance(x, dict)]
+    dict_patterns = [x for x in remove_list if type(x) is dict]
     if not dict_patterns:
         return
 
@@ -547,79 +930,82 @@ def _apply_remove_list_by_pattern(current_list: List[Any], remove_list: List[Any
         if len(pat) == 0:
             continue
         for item in current_list:
-            if not isinstance(item, dict):
+            if type(item) is not dict:
                 continue
-            if _matches_remove_pattern(item, pat, path + ["<list-item>"]):
-                _apply_remove(item, pat, path + ["<list-item>"])
+            if _matches_remove_pattern(item, pat):
+                _apply_remove(item, pat)
 
-    current_list[:] = [x for x in current_list if not (isinstance(x, dict) and len(x) == 0)]
+    current_list[:] = [x for x in current_list if not (type(x) is dict and len(x) == 0)]
 
 
-def _apply_remove(current: Any, remove_spec: Any, path: List[str]) -> Any:
+def _apply_remove(current: Any, remove_spec: Any) -> Any:
     if remove_spec is None:
         return current
 
-    if isinstance(current, list) and isinstance(remove_spec, list):
-        _apply_remove_list_by_pattern(current, remove_spec, path)
+    if type(current) is list and type(remove_spec) is list:
+        _apply_remove_list_by_pattern(current, remove_spec)
         return current
 
-    if isinstance(current, dict) and isinstance(remove_spec, dict):
-        for k, r_val in remove_spec.items():
-            if k not in current:
-                continue
+    # Dict specs mutate in place, so a work stack replaces recursion.
+    stack = [(current, remove_spec)]
+    while stack:
+        cur, spec = stack.pop()
+        if not (type(cur) is dict and type(spec) is dict):
+            continue
 
-            c_val = current.get(k)
+        # Intersect the key views in C instead of probing cur per spec key;
+        # the materialized set also keeps iteration safe across the pops.
+        for k in spec.keys() & cur.keys():
+            r_val = spec[k]
+            c_val = cur[k]
 
-            if isinstance(r_val, dict):
+            if type(r_val) is dict:
                 if len(r_val) == 0:
-                    current.pop(k, None)
-                    continue
-                if isinstance(c_val, dict):
-                    _apply_remove(c_val, r_val, path + [k])
+                    cur.pop(k, None)
+                elif type(c_val) is dict:
+                    stack.append((c_val, r_val))
                 else:
-                    current.pop(k, None)
+                    cur.pop(k, None)
                 continue
 
-            if isinstance(r_val, list):
+            if type(r_val) is list:
                 if len(r_val) == 0:
-                    current.pop(k, None)
-                    continue
-                if isinstance(c_val, list):
-                    _apply_remove_list_by_pattern(c_val, r_val, path + [k])
+                    cur.pop(k, None)
+                elif type(c_val) is list:
+                    _apply_remove_list_by_pattern(c_val, r_val)
                 else:
-                    current.pop(k, None)
+                    cur.pop(k, None)
                 continue
 
-            current.pop(k, None)
-
-        return current
+            cur.pop(k, None)
 
     return current
 
 
 def _strip_insert_index(node: Any) -> Any:
-    if isinstance(node, dict):
+    t = type(node)
+    if t is dict:
         out = {}
         for k, v in node.items():
             if k == "insert_index":
                 continue
             out[k] = _strip_insert_index(v)
         return out
-    if isinstance(node, list):
+    if t is list:
         return [_strip_insert_index(i) for i in node]
     return deep_copy(node)
 
 
-def _list_update_with_optional_insert_index(current_list: List[Any], update_list: List[Any], path: List[str]) -> None:
+def _list_update_with_optional_insert_index(current_list: List[Any], update_list: List[Any]) -> None:
     if not update_list:
         return
 
-    seen = {normalize(_strip_insert_index(item), path) for item in current_list}
+    seen = {_canon_digest_fresh(_strip_insert_index(item)) for item in current_list}
     indexed_patches: List[Tuple[int, Any]] = []
     non_indexed: List[Any] = []
 
     for raw in update_list:
-        if isinstance(raw, dict) and isinstance(raw.get("insert_index"), int):
+        if type(raw) is dict and isinstance(raw.get("insert_index"), int):
             idx = int(raw["insert_index"])
             patch = _strip_insert_index(raw)
             indexed_patches.append((idx, patch))
@@ -634,46 +1020,47 @@ def _list_update_with_optional_insert_index(current_list: List[Any], update_list
 
         if idx < len(current_list):
             target = current_list[idx]
-            if isinstance(target, dict) and isinstance(patch, dict):
-                _apply_update(target, patch, path + [f"[{idx}]"])
-            elif isinstance(target, list) and isinstance(patch, list):
-                _list_update_with_optional_insert_index(target, patch, path + [f"[{idx}]"])
+            if type(target) is dict and type(patch) is dict:
+                _apply_update(target, patch)
+            elif type(target) is list and type(patch) is list:
+                _list_update_with_optional_insert_index(target, patch)
         else:
             current_list.append(deep_copy(patch))
-            seen.add(normalize(patch, path))
+            seen.add(_canon_digest_fresh(patch))
 
     for item in non_indexed:
-        n = normalize(item, path)
-        if n in seen:
+        d = _canon_digest_fresh(item)
+        if d in seen:
             continue
-        seen.add(n)
+        seen.add(d)
         current_list.append(deep_copy(item))
 
 
-def _apply_update(current: Any, update_spec: Any, path: List[str]) -> Any:
+def _apply_update(current: Any, update_spec: Any) -> Any:
     if update_spec is None:
         return current
 
-    if isinstance(update_spec, dict):
-        if not isinstance(current, dict):
-            return current
-
-        for k, u_val in update_spec.items():
-            if k not in current:
-                current[k] = _strip_insert_index(u_val)
-                continue
+    if type(update_spec) is list and type(current) is list:
+        _list_update_with_optional_insert_index(current, update_spec)
+        return current
 
-            c_val = current.get(k)
-            if isinstance(u_val, dict) and isinstance(c_val, dict):
-                _apply_update(c_val, u_val, path + [k])
-            elif isinstance(u_val, list) and isinstance(c_val, list):
-                _list_update_with_optional_insert_index(c_val, u_val, path + [k])
+    # Dict specs mutate in place, so a work stack replaces recursion.
+    stack = [(current, update_spec)]
+    while stack:
+        cur, spec = stack.pop()
+        if not (type(cur) is dict and type(spec) is dict):
+            continue
 
-        return current
+        for k, u_val in spec.items():
+            if k not in cur:
+                cur[k] = _strip_insert_index(u_val)
+                continue
 
-    if isinstance(update_spec, list) and isinstance(current, list):
-        _list_update_with_optional_insert_index(current, update_spec, path)
-        return current
+            c_val = cur.get(k)
+            if type(u_val) is dict and type(c_val) is dict:
+                stack.append((c_val, u_val))
+            elif type(u_val) is list and type(c_val) is list:
+                _list_update_with_optional_insert_index(c_val, u_val)
 
     return current
 
@@ -696,6 +1083,14 @@ def _select_instructions_for_header(master: Dict[str, Any], header: str) -> Tupl
 
 
 def update_file(master: Dict[str, Any], input_manifest: Dict[str, Any], input_headers: List[str]) -> Dict[str, Any]:
+    """Apply master remove/update instructions to each header.
+
+    Consumes input_manifest destructively: headers are mutated in place and
+    referenced by the returned manifest. The pipeline hands the parsed input
+    straight here and never reads it again; a caller that needs the original
+    must deep_copy it first.
+    """
+    _reset_run_caches()
     updated_manifest: Dict[str, Any] = {}
 
     for header in input_headers:
@@ -703,13 +1098,13 @@ def update_file(master: Dict[str, Any], input_manifest: Dict[str, Any], input_he
         if working_header is None:
             continue
 
-        current = deep_copy(working_header)
+        current = working_header
         remove_spec, update_spec = _select_instructions_for_header(master, header)
 
         if remove_spec is not None:
-            current = _apply_remove(current, remove_spec, [header])
+            current = _apply_remove(current, remove_spec)
         if update_spec is not None:
-            current = _apply_update(current, update_spec, [header])
+            current = _apply_update(current, update_spec)
 
         updated_manifest[header] = current
 
@@ -728,42 +1123,50 @@ def write_console_log(
     total_text = sum(text_counts.values())
     total_unique = sum(unique_counts.values())
     total_missing = sum(missing_counts.values())
-    lines = []
-    lines.append(f"Headers processed: {len(input_headers)}")
-    lines.append(f"Total text_diff (leaf mismatches): {total_text}")
-    lines.append(f"Total unique_content (app-only): {total_unique}")
-    lines.append(f"Total missing_content (master-only): {total_missing}")
-    lines.append("")
-    lines.append(f"{master_label} | Text/Label Differences | Unique Data | Missing Data")
-    sorted_headers = sorted(
-        input_headers,
-        key=lambda h: text_counts.get(h, 0) + unique_counts.get(h, 0) + missing_counts.get(h, 0),
-        reverse=True,
-    )
-    for header in sorted_headers:
-        lines.append(
-            f"{header} | {text_counts.get(header, 0)} | {unique_counts.get(header, 0)} | {missing_counts.get(header, 0)}"
-        )
+    buf = io.StringIO()
+    buf.write(f"Headers processed: {len(input_headers)}\n")
+    buf.write(f"Total text_diff (leaf mismatches): {total_text}\n")
+    buf.write(f"Total unique_content (app-only): {total_unique}\n")
+    buf.write(f"Total missing_content (master-only): {total_missing}\n")
+    buf.write("\n")
+    buf.write(f"{master_label} | Text/Label Differences | Unique Data | Missing Data\n")
+    rows = [
+        (h, text_counts.get(h, 0), unique_counts.get(h, 0), missing_counts.get(h, 0))
+        for h in input_headers
+    ]
+    rows.sort(key=lambda r: r[1] + r[2] + r[3], reverse=True)
+    for h, t, u, m in rows:
+        buf.write(f"{h} | {t} | {u} | {m}\n")
 
     if isinstance(key_label_summary, list) and key_label_summary:
         rows = [r for r in key_label_summary if r.get("total_count", 0) >= 3]
         if rows:
-            lines.append("")
-            lines.append("Key Label | Total Count | Header Count")
+            buf.write("\n")
+            buf.write("Key Label | Total Count | Header Count\n")
             for row in rows:
-                lines.append(
-                    f"{row.get('key')} | {row.get('total_count', 0)} | {row.get('header_count', 0)}"
+                buf.write(
+                    f"{row.get('key')} | {row.get('total_count', 0)} | {row.get('header_count', 0)}\n"
                 )
 
-    print("\n".join(lines))
+    print(buf.getvalue(), end="")
 
 
 app_id = Input220.value
-input_manifest_raw = parse_json_maybe_double_encoded(FilePicker1.files[0]["readContents"]())
 mode = Dropdown130.selectedOptionValue
 print("Mode: ", mode)
 
-master_raw = parse_json_maybe_double_encoded(FilePicker2.files[0]["readContents"]())
+# The two FilePicker payloads are independent read+parse steps; overlap them.
+# The parses themselves serialize on the GIL (orjson holds it while building
+# Python objects) — the overlap win comes from the readContents() I/O.
+with ThreadPoolExecutor(max_workers=2) as _executor:
+    _input_future = _executor.submit(
+        lambda: parse_json_maybe_double_encoded(FilePicker1.files[0]["readContents"]())
+    )
+    _master_future = _executor.submit(
+        lambda: parse_json_maybe_double_encoded(FilePicker2.files[0]["readContents"]())
+    )
+    input_manifest_raw = _input_future.result()
+    master_raw = _master_future.result()
 master_label = extract_master_label(FilePicker2.files[0])
 input_manifest = unwrap_manifest(input_manifest_raw)
 master = unwrap_manifest(master_raw)
@@ -773,13 +1176,12 @@ mode_lower = mode.lower()
 if mode_lower == "update":
     return update_file(master, input_manifest, input_headers)
 
-audit_output, missing_counts, unique_counts, prefixes = build_audit(
-    input_manifest, master, input_headers
+audit_output, text_counts, missing_counts, unique_counts, prefixes = build_audit(
+    input_manifest,
+    master,
+    input_headers,
+    need_prefixes=mode_lower not in ("audit", "audit-text", "audit-structure"),
 )
-text_counts = {}
-for header in input_headers:
-    node = audit_output["text_diff"].get(header, {})
-    text_counts[header] = count_nodes(node) if node else 0
 
 write_console_log(
     input_headers,